@@ -1,8 +1,9 @@
 import random
+import numpy as np
 from ..config import (
-    CAR_MAX_CHARGE, CAR_CHARGING_THRESHOLD, CAR_CONSUMPTION_BASE, 
-    CAR_CONSUMPTION_VARIANCE, MAP_WIDTH, MAP_HEIGHT,
-    format_time, format_distance, logger
+    CAR_MAX_CHARGE, CAR_CHARGING_THRESHOLD, CAR_CONSUMPTION_BASE,
+    CAR_CONSUMPTION_VARIANCE, MAP_WIDTH, MAP_HEIGHT, NUM_CARS,
+    CAR_STATUS_CODES, format_time, format_distance, logger
 )
 from ..metrics import Metrics
 
@@ -10,11 +11,35 @@ class Car:
     cars: list = []
 
     _id_counter: int = 0
-    
+
+    # Per-car accounting in parallel float64 buffers (indexed by car_id - 1)
+    # so fleet-wide reductions and coordinate gathers are single C-level ops
+    _in_use_time_arr = np.zeros(max(NUM_CARS, 1))
+    _charging_time_arr = np.zeros(max(NUM_CARS, 1))
+    _idle_time_arr = np.zeros(max(NUM_CARS, 1))
+    _x_arr = np.zeros(max(NUM_CARS, 1))
+    _y_arr = np.zeros(max(NUM_CARS, 1))
+    _status_code_arr = np.zeros(max(NUM_CARS, 1), dtype=np.int8)
+
     @staticmethod
     def _get_next_id() -> int:
         Car._id_counter += 1
         return Car._id_counter
+
+    @staticmethod
+    def _ensure_buffer_capacity(n):
+        """Grow the per-car buffers (doubling) to hold at least n cars."""
+        capacity = Car._in_use_time_arr.shape[0]
+        if n > capacity:
+            new_capacity = max(n, capacity * 2)
+            pad = new_capacity - capacity
+            Car._in_use_time_arr = np.concatenate([Car._in_use_time_arr, np.zeros(pad)])
+            Car._charging_time_arr = np.concatenate([Car._charging_time_arr, np.zeros(pad)])
+            Car._idle_time_arr = np.concatenate([Car._idle_time_arr, np.zeros(pad)])
+            Car._x_arr = np.concatenate([Car._x_arr, np.zeros(pad)])
+            Car._y_arr = np.concatenate([Car._y_arr, np.zeros(pad)])
+            Car._status_code_arr = np.concatenate(
+                [Car._status_code_arr, np.zeros(pad, dtype=np.int8)])
     
     def calculate_energy_consumption(self, distance):
         """Calculate energy consumption for a given distance"""
@@ -28,23 +53,59 @@ class Car:
         self.max_charge = CAR_MAX_CHARGE
         self.charge_level = CAR_MAX_CHARGE
         self.charging_threshold = CAR_CHARGING_THRESHOLD
-        self.status = "available"  # available, reserved, in_use, charging, discharged, needs_charging
         self.car_id = Car._get_next_id()
         self.total_distance = 0  # total distance traveled
         self.cars.append(self)
-        self.idle_time = 0
-        self.in_use_time = 0
+        self._idx = self.car_id - 1
+        Car._ensure_buffer_capacity(self.car_id)
+        Car._x_arr[self._idx], Car._y_arr[self._idx] = self.location
+        self.status = "available"  # available, reserved, in_use, charging, discharged, needs_charging
         self.last_state_change = time
-        self.charging_time = 0
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, value):
+        self._status = value
+        # Mirror the state as a small int code for table-driven consumers
+        Car._status_code_arr[self._idx] = CAR_STATUS_CODES[value]
+
+    @property
+    def idle_time(self):
+        return Car._idle_time_arr[self._idx]
+
+    @property
+    def in_use_time(self):
+        return Car._in_use_time_arr[self._idx]
+
+    @property
+    def charging_time(self):
+        return Car._charging_time_arr[self._idx]
 
     def update_location(self, new_location):
         self.location = new_location
+        # Mirror into the SoA coordinate buffers for vectorized gathering
+        Car._x_arr[self._idx], Car._y_arr[self._idx] = new_location
+
+    def _add_idle_time(self, duration):
+        Car._idle_time_arr[self._idx] += duration
+        Metrics.record_idle_time(duration)
+
+    def _add_in_use_time(self, duration):
+        Car._in_use_time_arr[self._idx] += duration
+        Metrics.record_in_use_time(duration)
+
+    def _add_charging_time(self, duration):
+        Car._charging_time_arr[self._idx] += duration
+        Metrics.record_charging_time(duration)
 
     def reserve(self, time):
         self.status = "reserved"
-        self.idle_time += time - self.last_state_change
+        self._add_idle_time(time - self.last_state_change)
         self.last_state_change = time
-    
+
     def start_use(self, time):
         """Transition car to in_use state when user picks it up"""
         if self.status == "reserved":
@@ -52,32 +113,32 @@ class Car:
             pass
         else:
             # Track time in previous state
-            self.idle_time += time - self.last_state_change
-        
+            self._add_idle_time(time - self.last_state_change)
+
         self.status = "in_use"
         self.last_state_change = time
 
     def free_up(self, time):
         self.status = "available"
-        self.in_use_time += time - self.last_state_change
+        self._add_in_use_time(time - self.last_state_change)
         self.last_state_change = time
-    
+
     def start_charging(self, time):
         """Transition car to charging state"""
         if self.status != "charging":
             # Track time in previous state
             if self.status == "in_use":
-                self.in_use_time += time - self.last_state_change
+                self._add_in_use_time(time - self.last_state_change)
             elif self.status in ["available", "needs_charging", "discharged"]:
-                self.idle_time += time - self.last_state_change
-            
+                self._add_idle_time(time - self.last_state_change)
+
             self.status = "charging"
             self.last_state_change = time
-    
+
     def stop_charging(self, time):
         """Transition car out of charging state"""
         if self.status == "charging":
-            self.charging_time += time - self.last_state_change
+            self._add_charging_time(time - self.last_state_change)
             self.status = "available"
             self.last_state_change = time
 
@@ -13,8 +13,8 @@ class User:
         return User._id_counter
 
     def __init__(self, simulator, time):
-        from ..events import reservation_event
-        
+        from ..events import EventType
+
         # progressive id for each user
         self.user_id = User._get_next_id()
         self.simulator = simulator
@@ -24,4 +24,4 @@ class User:
         res_time = time + 60 * random.expovariate(USER_RESERVATION_RATE)
         location = (random.uniform(0, MAP_WIDTH), random.uniform(0, MAP_HEIGHT))
         self.reservation_time = res_time
-        simulator.schedule_event(res_time, reservation_event, (self, location))
+        simulator.schedule_event(res_time, EventType.RESERVATION, (self, location))
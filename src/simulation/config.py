@@ -7,6 +7,7 @@ to a YAML file path, or invoke the CLI `python -m src.simulation --config path`.
 """
 
 import os
+from enum import IntEnum
 from typing import Any, Dict
 
 try:
@@ -249,6 +250,35 @@ CAR_COLORS = {
     "needs_charging": "yellow",
 }
 
+
+class CarStatus(IntEnum):
+    """Integer codes for car states, used for branchless table lookups."""
+    AVAILABLE = 0
+    RESERVED = 1
+    IN_USE = 2
+    CHARGING = 3
+    DISCHARGED = 4
+    NEEDS_CHARGING = 5
+
+
+# Status-string -> code mapping and code-indexed color table
+CAR_STATUS_CODES = {
+    "available": CarStatus.AVAILABLE,
+    "reserved": CarStatus.RESERVED,
+    "in_use": CarStatus.IN_USE,
+    "charging": CarStatus.CHARGING,
+    "discharged": CarStatus.DISCHARGED,
+    "needs_charging": CarStatus.NEEDS_CHARGING,
+}
+CAR_COLOR_TABLE = [
+    CAR_COLORS["available"],
+    CAR_COLORS["reserved"],
+    CAR_COLORS["in_use"],
+    CAR_COLORS["charging"],
+    CAR_COLORS["discharged"],
+    CAR_COLORS["needs_charging"],
+]
+
 # Colors for relocator states
 RELOCATOR_COLORS = {
     "available": "cyan",
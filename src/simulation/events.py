@@ -4,9 +4,10 @@ Each event function follows the pattern: event_function(time, payload, simulator
 """
 
 import random
+from enum import IntEnum
 from . import config
 from .config import (
-    BIN_INTERVAL, USER_RESERVATION_RATE, USER_PICKUP_RATE, NO_CAR_RETRY_RATE,
+    USER_RESERVATION_RATE, USER_PICKUP_RATE, NO_CAR_RETRY_RATE,
     WALKING_SPEED, MAP_WIDTH, MAP_HEIGHT, MAX_USERS, USER_MAX_RESERVATION_ATTEMPTS,
     MAX_PICKUP_DISTANCE, get_current_arrival_rate, format_time, format_distance,
     format_location, logger
@@ -14,6 +15,23 @@ from .config import (
 from .metrics import Metrics
 
 
+class EventType(IntEnum):
+    """Integer codes identifying event handlers.
+
+    The FES stores these small ints instead of function objects: heap
+    entries stay compact and dispatch is a flat index into EVENT_HANDLERS
+    at the bottom of this module."""
+    USER_SUBSCRIPTION = 0
+    RESERVATION = 1
+    PICKUP = 2
+    DROPOFF = 3
+    RELOCATE_CAR = 4
+    ARRIVE_AT_STATION = 5
+    CHARGING_COMPLETE = 6
+    BIN_COLLECTION = 7
+    VISUALIZATION_UPDATE = 8
+
+
 # ============================================================================
 # USER EVENTS
 # ============================================================================
@@ -31,7 +49,7 @@ def user_subscription_event(time, payload, simulator):
     if user_mod.User._id_counter < config.MAX_USERS:
         current_rate = get_current_arrival_rate(time)
         next_arrival_time = time + 60 * random.expovariate(current_rate)
-        simulator.schedule_event(next_arrival_time, user_subscription_event, ())
+        simulator.schedule_event(next_arrival_time, EventType.USER_SUBSCRIPTION, ())
 
 
 def reservation_event(time, payload, simulator):
@@ -76,12 +94,12 @@ def reservation_event(time, payload, simulator):
             # Schedule next reservation
             new_res_time = time + 60 * random.expovariate(USER_RESERVATION_RATE)
             new_location = (random.uniform(0, MAP_WIDTH), random.uniform(0, MAP_HEIGHT))
-            simulator.schedule_event(new_res_time, reservation_event, (user, new_location))
+            simulator.schedule_event(new_res_time, EventType.RESERVATION, (user, new_location))
             return
         
         # Retry
         next_trial = time + 60 * random.expovariate(NO_CAR_RETRY_RATE)
-        simulator.schedule_event(next_trial, reservation_event, (user, location))
+        simulator.schedule_event(next_trial, EventType.RESERVATION, (user, location))
         return
     
     # Successful reservation
@@ -116,7 +134,7 @@ def reservation_event(time, payload, simulator):
     
     # Schedule pickup
     pickup_time = time + max(0.0, 60.0 * walking_time)
-    simulator.schedule_event(pickup_time, pickup_event, (user, car, location, location))
+    simulator.schedule_event(pickup_time, EventType.PICKUP, (user, car, location, location))
 
 
 def pickup_event(time, payload, simulator):
@@ -143,7 +161,7 @@ def pickup_event(time, payload, simulator):
     user.first_reservation_time = None
     user.reservation_success_time = None
     
-    simulator.schedule_event(dropoff_time, dropoff_event, (user, car, start_location, destination))
+    simulator.schedule_event(dropoff_time, EventType.DROPOFF, (user, car, start_location, destination))
 
 
 def dropoff_event(time, payload, simulator):
@@ -174,12 +192,12 @@ def dropoff_event(time, payload, simulator):
         else:
             logger.warning(f"[{format_time(time)}] Car {car.car_id} needs charging (charge: {car.charge_level:.1f} kWh)")
         
-        simulator.schedule_event(time, relocate_car_event, car)
+        simulator.schedule_event(time, EventType.RELOCATE_CAR, car)
     
     # Schedule user's next reservation
     res_time = time + 60 * random.expovariate(USER_RESERVATION_RATE)
     location = (random.uniform(0, MAP_WIDTH), random.uniform(0, MAP_HEIGHT))
-    simulator.schedule_event(res_time, reservation_event, (user, location))
+    simulator.schedule_event(res_time, EventType.RESERVATION, (user, location))
 
 
 # ============================================================================
@@ -199,7 +217,7 @@ def relocate_car_event(time, payload, simulator):
     if relocator is None:
         logger.warning(f"[{format_time(time)}] No relocator available for car {car.car_id}, retrying in 5 minutes")
         retry_time = time + 5
-        simulator.schedule_event(retry_time, relocate_car_event, car)
+        simulator.schedule_event(retry_time, EventType.RELOCATE_CAR, car)
         return
     
     # Find nearest station
@@ -218,7 +236,7 @@ def relocate_car_event(time, payload, simulator):
         travel_time = relocator.calculate_travel_time(car.location, station.location, simulator.road_map)
         arrival_time = time + (travel_time * 60.0)
         
-        simulator.schedule_event(arrival_time, arrive_at_station_with_relocator_event, (car, station, relocator))
+        simulator.schedule_event(arrival_time, EventType.ARRIVE_AT_STATION, (car, station, relocator))
     else:
         logger.error(f"[{format_time(time)}] Failed to assign relocator {relocator.relocator_id} to car {car.car_id}")
 
@@ -241,7 +259,7 @@ def arrive_at_station_with_relocator_event(time, payload, simulator):
     charging_time = 2  # hours
     
     completion_time = time + (charging_time * 60.0)  # convert to minutes
-    simulator.schedule_event(completion_time, charging_complete_event, (car, station))
+    simulator.schedule_event(completion_time, EventType.CHARGING_COMPLETE, (car, station))
 
 
 def charging_complete_event(time, payload, simulator):
@@ -261,13 +279,28 @@ def charging_complete_event(time, payload, simulator):
 # ============================================================================
 
 def bin_collection_event(time, payload, simulator):
-    """Collect a snapshot of current metrics into a bin for later analysis."""
+    """Collect a snapshot of current metrics into a bin for later analysis.
+
+    The whole series of collection times is batch-scheduled up front by the
+    simulator, so this handler does not reschedule itself."""
     total_reservations = Metrics._successful_reservations + Metrics._failed_reservations
     if total_reservations > 0:
         Metrics.snapshot_bin(time)
-    
-    next_bin_time = time + BIN_INTERVAL
-    simulator.schedule_event(next_bin_time, bin_collection_event, None)
+
+
+# ============================================================================
+# VISUALIZATION EVENT
+# ============================================================================
+
+def visualization_update_event(time, payload, simulator):
+    """Redraw the visualization and reschedule at a fixed sim-time interval.
+
+    Running this as a periodic event keeps the frame rate independent of
+    event density instead of redrawing after every event."""
+    simulator.visualizer.update(time)
+
+    next_update_time = time + config.VISUALIZATION_UPDATE_INTERVAL * 60
+    simulator.schedule_event(next_update_time, EventType.VISUALIZATION_UPDATE, None)
 
 
 # ============================================================================
@@ -280,3 +313,22 @@ def _distance_between(loc1, loc2, road_map=None):
         return road_map.calculate_route_distance(loc1, loc2)
     else:
         return ((loc1[0] - loc2[0]) ** 2 + (loc1[1] - loc2[1]) ** 2) ** 0.5
+
+
+# ============================================================================
+# DISPATCH TABLE
+# ============================================================================
+
+# Flat handler table indexed by EventType; the simulator's main loop
+# dispatches through this instead of storing callables in the FES
+EVENT_HANDLERS = [
+    user_subscription_event,
+    reservation_event,
+    pickup_event,
+    dropoff_event,
+    relocate_car_event,
+    arrive_at_station_with_relocator_event,
+    charging_complete_event,
+    bin_collection_event,
+    visualization_update_event,
+]
@@ -249,7 +249,7 @@ class RoadMap:
             edges_data.append({
                 'start': (node1_data['x'], node1_data['y']),
                 'end': (node2_data['x'], node2_data['y']),
-                'distance': edge_data['weight']
+                'distance': edge_data['distance']
             })
         
         return nodes_data, edges_data
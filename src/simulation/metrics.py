@@ -1,9 +1,160 @@
+import functools
 import json
+import logging
 import os
 import math
-import matplotlib.pyplot as plt
+from collections import namedtuple
+
+import numpy as np
 from .config import format_time, format_distance, logger, format_duration
 
+
+def _import_pyplot(headless):
+    """Import matplotlib.pyplot lazily so headless simulation workers that
+    never plot don't pay the matplotlib import cost at module load."""
+    import matplotlib
+    if headless:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+try:
+    from numba import njit  # type: ignore
+except Exception:
+    njit = None  # Optional dependency; pure-NumPy fallback
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # Optional dependency; stdlib json fallback
+
+
+def _dumps_compact(obj):
+    """Serialize to a compact JSON string (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+_Car = None
+
+
+def _car_cls():
+    """Resolve the Car class once (Car imports Metrics, so a top-level
+    import here would be circular); later calls are a global read."""
+    global _Car
+    if _Car is None:
+        from .Entities.Car import Car as _Car_cls
+        _Car = _Car_cls
+    return _Car
+
+
+def _plot_metrics_job(bin_columns, bin_count, save_dir):
+    """Render the transient plots in a worker process.
+
+    Receives copies of the bin columns (plain NumPy arrays, picklable) and
+    rebuilds the columnar store in the worker so the plotting code runs
+    unchanged there.
+    """
+    Metrics._bin_columns = bin_columns
+    Metrics._bin_count = bin_count
+    Metrics._bin_capacity = bin_count
+    Metrics.plot_all_metrics_transient(save_dir=save_dir)
+
+
+# Full outcome of a transient detection run, including the intermediate
+# curves, so plotting can reuse them instead of recomputing
+TransientResult = namedtuple('TransientResult', [
+    'transient_end', 'steady_mean', 'steady_std', 'num_steady_bins',
+    'values', 'valid_indices', 'relative_variations', 'knee_index',
+    'analysis_length',
+])
+
+
+@functools.lru_cache(maxsize=512)
+def _t_critical(n, confidence):
+    """Two-sided Student-t critical value for n samples at the given confidence level.
+
+    Cached so repeat calls with the same (n, confidence) — e.g. the many
+    phases in compute_cycle_stationary_intervals — don't recompute the ppf.
+    """
+    from scipy import stats
+    return float(stats.t.ppf((1.0 + confidence) / 2.0, n - 1))
+
+
+def _compute_relative_variations(values, max_k):
+    """Compute the relative variation curve R_k for transient detection.
+
+    R_k = |x_k - x̄| / |x̄| where x_k is the mean of values[k:] (truncated mean)
+    and x̄ is the overall mean. Uses a running suffix sum so the whole curve
+    costs O(n) instead of O(n²).
+
+    Args:
+        values: float64 array of bin metric values
+        max_k: Number of truncation indices to evaluate
+
+    Returns:
+        float64 array of length max_k with the R_k values
+    """
+    n = values.shape[0]
+    total = 0.0
+    for j in range(n):
+        total += values[j]
+    overall_mean = total / n
+    if abs(overall_mean) < 1e-10:
+        overall_mean = 1e-10
+
+    # Hoist the |x̄| division out of the loop (multiply by the inverse) and
+    # inline abs on the residual — a branch is cheaper than a call here
+    inv_abs_mean = 1.0 / abs(overall_mean)
+
+    rel_vars = np.empty(max_k, dtype=np.float64)
+    running = total
+    for k in range(max_k):
+        diff = running / (n - k) - overall_mean
+        if diff < 0.0:
+            diff = -diff
+        rel_vars[k] = diff * inv_abs_mean
+        running -= values[k]
+    return rel_vars
+
+
+def _cycle_phase_sums(phases, values, num_phases):
+    """Accumulate per-phase sum, sum of squares and count in a single pass.
+
+    Fuses the three bincount reductions used by cycle-stationary analysis
+    into one scan over the (phase, value) pairs.
+
+    Args:
+        phases: int64 array of cycle-phase indices
+        values: float64 array of metric values, aligned with phases
+        num_phases: Number of phases in one cycle
+
+    Returns:
+        (sums, sumsqs, counts) float64/float64/int64 arrays of length num_phases
+    """
+    sums = np.zeros(num_phases, dtype=np.float64)
+    sumsqs = np.zeros(num_phases, dtype=np.float64)
+    counts = np.zeros(num_phases, dtype=np.int64)
+    for i in range(phases.shape[0]):
+        p = phases[i]
+        v = values[i]
+        sums[p] += v
+        sumsqs[p] += v * v
+        counts[p] += 1
+    return sums, sumsqs, counts
+
+
+if njit is not None:
+    # JIT-compile the hot numeric loops. cache=True persists the compiled
+    # code in __pycache__ so repeat runs skip the compilation cost, and
+    # fastmath relaxes FP ordering so the reductions can vectorize. All
+    # callers pass stable (float64 array, int) signatures so a single
+    # compilation gets cached per helper.
+    _jit = njit(cache=True, fastmath=True)
+    _compute_relative_variations = _jit(_compute_relative_variations)
+    _cycle_phase_sums = _jit(_cycle_phase_sums)
+
 class Metrics:
     # Reservation metrics
     _successful_reservations = 0
@@ -29,14 +180,61 @@ class Metrics:
     _total_in_use_time = 0.0  # time cars spent being used
     _total_charging_time = 0.0  # time cars spent charging
     
+    # Running totals of car state times, maintained incrementally by Car
+    # state transitions so snapshots don't have to re-sum the whole fleet
+    _agg_in_use_time = 0.0
+    _agg_charging_time = 0.0
+    _agg_idle_time = 0.0
+
     # Charging station metrics
     _total_charging_sessions = 0
     _total_queue_length = 0  # sum of queue lengths sampled
     _total_queue_samples = 0  # number of times queue was sampled
     
-    # Binning support for transient detection and confidence intervals
-    _bins = []  # List of snapshots: [{time, successful_reservations, failed_reservations, ...}]
+    # Binning support for transient detection and confidence intervals.
+    # Bins are stored column-wise (SoA): one NumPy array per metric, grown by
+    # doubling. This keeps slicing zero-copy for the analysis code instead of
+    # paying a dict allocation per bin.
+    _BIN_KEYS = (
+        'time',
+        'bin_successful_reservations',
+        'bin_failed_reservations',
+        'bin_total_trips',
+        'bin_total_distance',
+        'bin_attempts',
+        'bin_in_use_time',
+        'bin_car_time',
+        'bin_charging_time',
+        'bin_success_rate',
+        'bin_avg_attempts',
+        'bin_avg_trip_distance',
+        'bin_utilization_rate',
+    )
+    # Narrow dtypes where precision permits: counters fit int32, rates fit
+    # float32 (halving the bytes swept by the analysis passes); times and
+    # accumulated durations stay float64. Reductions over float32 columns
+    # accumulate in float64.
+    _BIN_DTYPES = {
+        'time': np.float64,
+        'bin_successful_reservations': np.int32,
+        'bin_failed_reservations': np.int32,
+        'bin_total_trips': np.int32,
+        'bin_total_distance': np.float64,
+        'bin_attempts': np.int32,
+        'bin_in_use_time': np.float64,
+        'bin_car_time': np.float64,
+        'bin_charging_time': np.float64,
+        'bin_success_rate': np.float32,
+        'bin_avg_attempts': np.float32,
+        'bin_avg_trip_distance': np.float32,
+        'bin_utilization_rate': np.float32,
+    }
+    _bin_columns = {}  # key -> np.ndarray; allocated on first snapshot
+    _bin_count = 0  # number of filled bins
+    _bin_capacity = 0  # allocated length of each column
     _last_bin_snapshot = None  # Snapshot state at last bin boundary
+    _cycle_phase_cache = None  # (key, mask, phases) for cycle-CI reuse
+    _plot_pool = None  # Background process pool for plot generation
     
     @staticmethod
     def record_successful_reservation():
@@ -78,6 +276,21 @@ class Metrics:
         This method is kept for backward compatibility but does nothing."""
         pass
     
+    @staticmethod
+    def record_in_use_time(duration):
+        """Record time a car spent in use (called on car state transitions)"""
+        Metrics._agg_in_use_time += duration
+
+    @staticmethod
+    def record_charging_time(duration):
+        """Record time a car spent charging (called on car state transitions)"""
+        Metrics._agg_charging_time += duration
+
+    @staticmethod
+    def record_idle_time(duration):
+        """Record time a car spent idle (called on car state transitions)"""
+        Metrics._agg_idle_time += duration
+
     @staticmethod
     def record_station_queue(queue_length):
         """Record a charging station queue sample"""
@@ -93,124 +306,169 @@ class Metrics:
     def snapshot_bin(time):
         """Capture a snapshot of current metrics for bin analysis.
         Stores the delta from the last snapshot to get per-bin statistics."""
-        from .Entities.Car import Car
-        
-        # Aggregate car utilization times from all cars
-        total_in_use_time = sum(car.in_use_time for car in Car.cars)
-        total_charging_time = sum(car.charging_time for car in Car.cars)
-        total_idle_time = sum(car.idle_time for car in Car.cars)
+        # Bind the class once; this method runs every BIN_INTERVAL and each
+        # Metrics._xxx read is a separate attribute resolution otherwise
+        cls = Metrics
+
+        # Car utilization times are maintained incrementally on state
+        # transitions, so the snapshot just reads three floats
+        total_in_use_time = cls._agg_in_use_time
+        total_charging_time = cls._agg_charging_time
+        total_idle_time = cls._agg_idle_time
         total_car_time = total_in_use_time + total_charging_time + total_idle_time
         
-        current_state = {
-            'successful_reservations': Metrics._successful_reservations,
-            'failed_reservations': Metrics._failed_reservations,
-            'total_wait_time': Metrics._total_wait_time,
-            'total_waiting_users': Metrics._total_waiting_users,
-            'total_walking_time': Metrics._total_walking_time,
-            'total_walking_users': Metrics._total_walking_users,
-            'total_trips': Metrics._total_trips,
-            'total_trip_distance': Metrics._total_trip_distance,
-            'total_attempts': Metrics._total_attempts_before_success,
-            'total_car_time': total_car_time,
-            'total_in_use_time': total_in_use_time,
-            'total_charging_time': total_charging_time,
-            'total_charging_sessions': Metrics._total_charging_sessions,
-        }
-        
-        if Metrics._last_bin_snapshot is None:
+        # Pack the cumulative state into a fixed-order vector so the delta
+        # from the previous snapshot is a single array subtraction
+        current_state = np.array([
+            cls._successful_reservations,
+            cls._failed_reservations,
+            cls._total_wait_time,
+            cls._total_waiting_users,
+            cls._total_walking_time,
+            cls._total_walking_users,
+            cls._total_trips,
+            cls._total_trip_distance,
+            cls._total_attempts_before_success,
+            total_car_time,
+            total_in_use_time,
+            total_charging_time,
+            cls._total_charging_sessions,
+        ], dtype=np.float64)
+
+        if cls._last_bin_snapshot is None:
             # First bin: delta is the current state itself
-            delta = {k: v for k, v in current_state.items()}
+            delta = current_state.copy()
         else:
             # Compute delta since last snapshot
-            delta = {k: current_state[k] - Metrics._last_bin_snapshot[k] 
-                    for k in current_state.keys()}
-        
-        # Compute derived metrics for this bin
-        bin_data = {
-            'time': time,
-            'bin_successful_reservations': delta['successful_reservations'],
-            'bin_failed_reservations': delta['failed_reservations'],
-            'bin_total_trips': delta['total_trips'],
-            'bin_total_distance': delta['total_trip_distance'],
-            'bin_attempts': delta['total_attempts'],
-            'bin_in_use_time': delta['total_in_use_time'],
-            'bin_car_time': delta['total_car_time'],
-            'bin_charging_time': delta['total_charging_time'],
-        }
-        
+            delta = current_state - cls._last_bin_snapshot
+
+        (d_successful, d_failed, _d_wait_time, _d_waiting_users,
+         _d_walking_time, _d_walking_users, d_trips, d_trip_distance,
+         d_attempts, d_car_time, d_in_use_time, d_charging_time,
+         _d_charging_sessions) = delta
+
         # Compute per-bin averages
-        total_res = delta['successful_reservations'] + delta['failed_reservations']
-        bin_data['bin_success_rate'] = (delta['successful_reservations'] / total_res 
-                                         if total_res > 0 else 0.0)
-        bin_data['bin_avg_attempts'] = (delta['total_attempts'] / delta['successful_reservations']
-                                         if delta['successful_reservations'] > 0 else 0.0)
-        bin_data['bin_avg_trip_distance'] = (delta['total_trip_distance'] / delta['total_trips']
-                                              if delta['total_trips'] > 0 else 0.0)
-        bin_data['bin_utilization_rate'] = (delta['total_in_use_time'] / delta['total_car_time']
-                                             if delta['total_car_time'] > 0 else 0.0)
-        
-        Metrics._bins.append(bin_data)
-        Metrics._last_bin_snapshot = current_state
-        
-        logger.debug(f"[{format_time(time)}] Bin {len(Metrics._bins)} collected: "
-                    f"{bin_data['bin_total_trips']} trips, "
-                    f"success_rate={bin_data['bin_success_rate']*100:.1f}%")
+        total_res = d_successful + d_failed
+        success_rate = d_successful / total_res if total_res > 0 else 0.0
+        avg_attempts = d_attempts / d_successful if d_successful > 0 else 0.0
+        avg_trip_distance = d_trip_distance / d_trips if d_trips > 0 else 0.0
+        utilization_rate = d_in_use_time / d_car_time if d_car_time > 0 else 0.0
+
+        # Append the bin record in _BIN_KEYS order (no dict intermediary)
+        cls._append_bin((
+            time, d_successful, d_failed, d_trips, d_trip_distance, d_attempts,
+            d_in_use_time, d_car_time, d_charging_time,
+            success_rate, avg_attempts, avg_trip_distance, utilization_rate,
+        ))
+        cls._last_bin_snapshot = current_state
+
+        logger.debug(f"[{format_time(time)}] Bin {cls._bin_count} collected: "
+                    f"{int(d_trips)} trips, "
+                    f"success_rate={success_rate*100:.1f}%")
 
     
+    @staticmethod
+    def _append_bin(values):
+        """Append one bin record (a sequence in _BIN_KEYS order) to the
+        columnar store, growing by doubling."""
+        if Metrics._bin_count == Metrics._bin_capacity:
+            new_capacity = max(64, Metrics._bin_capacity * 2)
+            for key in Metrics._BIN_KEYS:
+                new_col = np.empty(new_capacity, dtype=Metrics._BIN_DTYPES[key])
+                old_col = Metrics._bin_columns.get(key)
+                if old_col is not None:
+                    new_col[:Metrics._bin_count] = old_col[:Metrics._bin_count]
+                Metrics._bin_columns[key] = new_col
+            Metrics._bin_capacity = new_capacity
+
+        idx = Metrics._bin_count
+        for key, value in zip(Metrics._BIN_KEYS, values):
+            Metrics._bin_columns[key][idx] = value
+        Metrics._bin_count = idx + 1
+
+    @staticmethod
+    def get_column(key):
+        """Return the filled portion of a bin column as a NumPy array (zero-copy view)."""
+        if Metrics._bin_count == 0:
+            return np.empty(0, dtype=np.float64)
+        return Metrics._bin_columns[key][:Metrics._bin_count]
+
     @staticmethod
     def get_bins():
-        """Return the list of collected bins"""
-        return Metrics._bins
+        """Return the collected bins as a list of dicts (reconstructed from columns)."""
+        columns = {key: Metrics.get_column(key) for key in Metrics._BIN_KEYS}
+        return [{key: columns[key][i] for key in Metrics._BIN_KEYS}
+                for i in range(Metrics._bin_count)]
     
     @staticmethod
     def detect_transient_welch(metric_key='bin_success_rate', window_fraction=0.25, min_valid_bins=10):
         """Detect end of transient phase using truncated mean method with knee detection.
-        
+
         Computes:
         1. Truncated mean x_k = (1/(n-k)) * sum(x_j for j=k+1 to n)
         2. Overall mean x̄ = (1/n) * sum(x_j for j=1 to n)
         3. Relative variation R_k = |x_k - x̄| / x̄
-        
+
         Identifies the knee point in R_k curve automatically.
-        
+
         Args:
             metric_key: Which bin metric to analyze (e.g., 'bin_success_rate', 'bin_avg_attempts')
             window_fraction: Not used (kept for API compatibility)
             min_valid_bins: Minimum number of non-zero bins needed for analysis
-        
+
         Returns:
             (transient_end_bin, steady_state_mean, steady_state_std, num_steady_bins) or (None, None, None, 0)
             - transient_end_bin: The bin index where transient phase ends
             - steady_state_mean: Mean of the metric in steady state
-            - steady_state_std: Standard deviation in steady state  
+            - steady_state_std: Standard deviation in steady state
             - num_steady_bins: Number of bins used for steady-state statistics
         """
-        if len(Metrics._bins) < min_valid_bins:
-            return None, None, None, 0
-        
+        result = Metrics._detect_transient(metric_key, min_valid_bins)
+        return (result.transient_end, result.steady_mean, result.steady_std,
+                result.num_steady_bins)
+
+    @staticmethod
+    def _detect_transient(metric_key='bin_success_rate', min_valid_bins=10):
+        """Full transient detection, keeping the intermediate curves.
+
+        Returns a TransientResult so plotting can reuse the relative-variation
+        curve and knee index instead of recomputing them.
+        """
+        if Metrics._bin_count < min_valid_bins:
+            return TransientResult(None, None, None, 0, None, None, None, None, 0)
+
         # Exclude the last bin as it may be incomplete (simulation ended mid-interval)
-        bins_to_analyze = Metrics._bins[:-1] if len(Metrics._bins) > 1 else Metrics._bins
-        
-        # Filter out bins with no activity
-        valid_bins = []
-        valid_indices = []
-        for i, b in enumerate(bins_to_analyze):
-            if b['bin_successful_reservations'] + b['bin_failed_reservations'] > 0:
-                valid_bins.append(b)
-                valid_indices.append(i)
-        
-        if len(valid_bins) < min_valid_bins:
-            return None, None, None, 0
-        
-        values = [b[metric_key] for b in valid_bins]
+        end = Metrics._bin_count - 1 if Metrics._bin_count > 1 else Metrics._bin_count
+
+        # Filter out bins with no activity (single vectorized mask)
+        succ = Metrics.get_column('bin_successful_reservations')[:end]
+        fail = Metrics.get_column('bin_failed_reservations')[:end]
+        mask = (succ + fail) > 0
+        valid_indices = np.flatnonzero(mask)
+
+        if valid_indices.size < min_valid_bins:
+            return TransientResult(None, None, None, 0, None, None, None, None, 0)
+
+        values = Metrics.get_column(metric_key)[:end][mask].astype(np.float64)
         n = len(values)
-        
+
         # Need at least 20 bins for reliable detection
         if n < 20:
-            mean_val = sum(values) / n
-            var_val = sum((x - mean_val)**2 for x in values) / n if n > 1 else 0.0
-            std_val = math.sqrt(var_val) if var_val > 0 else 0.0
-            return valid_indices[0] if valid_indices else 0, mean_val, std_val, n
+            return TransientResult(int(valid_indices[0]) if valid_indices.size else 0,
+                                   float(values.mean()), float(values.std()), n,
+                                   values, valid_indices, None, None, 0)
+
+        # Prefix sums of x and x² give O(1) mean/std for any suffix, so the
+        # steady-state statistics below cost no extra pass over the data
+        cs = np.concatenate(([0.0], np.cumsum(values)))
+        cs2 = np.concatenate(([0.0], np.cumsum(values * values)))
+
+        def _suffix_stats(k):
+            """Mean and (population) std of values[k:] from the prefix sums."""
+            count = n - k
+            mean = (cs[n] - cs[k]) / count
+            variance = max(0.0, (cs2[n] - cs2[k]) / count - mean * mean)
+            return float(mean), math.sqrt(variance)
         
         # IMPORTANT: Only analyze the first portion of the simulation for transient detection
         # Transient phases typically occur early. Looking at the entire simulation 
@@ -220,32 +478,16 @@ class Metrics:
         values_for_analysis = values[:analysis_length]
         n_analysis = len(values_for_analysis)
         
-        # Step 1: Compute overall mean x̄ using the FULL dataset (for comparison)
-        overall_mean = sum(values) / n
-        
-        # Avoid division by zero in relative variation
-        if abs(overall_mean) < 1e-10:
-            overall_mean = 1e-10
-        
-        # Step 2: Compute truncated means x_k and relative variations R_k
-        # Only for the analysis portion (early bins)
-        truncated_means = []
-        relative_variations = []
-        
+        # Steps 1-2: Compute overall mean x̄, truncated means x_k and relative
+        # variations R_k in a single suffix-sum pass (JIT-compiled when numba
+        # is available). Truncated means average from k to the END OF FULL
+        # DATASET: "if we skip the first k bins, what's the mean of the rest?"
         # We compute for k from 0 to n_analysis-min_valid_bins
         max_k = n_analysis - min_valid_bins
-        
-        for k in range(max_k):
-            # Truncated mean: average from k+1 to END OF FULL DATASET
-            # This way we're asking "if we skip the first k bins, what's the mean of the rest?"
-            truncated_data = values[k:]
-            x_k = sum(truncated_data) / len(truncated_data)
-            truncated_means.append(x_k)
-            
-            # Relative variation R_k = |x_k - x̄| / |x̄|
-            R_k = abs(x_k - overall_mean) / abs(overall_mean)
-            relative_variations.append(R_k)
-        
+        relative_variations = _compute_relative_variations(
+            np.asarray(values, dtype=np.float64), max_k
+        )
+
         # Step 3: Find the knee point in R_k curve
         # Use the "maximum distance from line" method (perpendicular distance)
         knee_index = Metrics._find_knee_point(relative_variations)
@@ -258,23 +500,24 @@ class Metrics:
         if knee_index is not None and 0 <= knee_index < len(valid_indices):
             # Map to the original bin index
             # valid_indices[knee_index] gives us the actual bin number
-            transient_end = valid_indices[knee_index]
-            
-            # Compute steady-state statistics from knee point onward
-            steady_values = values[knee_index:]
-            num_steady_bins = len(steady_values)
+            transient_end = int(valid_indices[knee_index])
             
-            if steady_values:
-                steady_mean = sum(steady_values) / len(steady_values)
-                steady_var = sum((x - steady_mean)**2 for x in steady_values) / len(steady_values) if len(steady_values) > 1 else 0.0
-                steady_std = math.sqrt(steady_var) if steady_var > 0 else 0.0
-                return transient_end, steady_mean, steady_std, num_steady_bins
-        
+            # Compute steady-state statistics from knee point onward (O(1))
+            num_steady_bins = n - knee_index
+
+            if num_steady_bins > 0:
+                steady_mean, steady_std = _suffix_stats(knee_index)
+                return TransientResult(transient_end, steady_mean, steady_std,
+                                       num_steady_bins,
+                                       values, valid_indices, relative_variations,
+                                       knee_index, analysis_length)
+
         # Fallback: if no clear knee detected, use entire series
-        mean_val = sum(values) / n
-        var_val = sum((x - mean_val)**2 for x in values) / n if n > 1 else 0.0
-        std_val = math.sqrt(var_val) if var_val > 0 else 0.0
-        return valid_indices[0] if valid_indices else 0, mean_val, std_val, n
+        full_mean, full_std = _suffix_stats(0)
+        return TransientResult(int(valid_indices[0]) if valid_indices.size else 0,
+                               full_mean, full_std, n,
+                               values, valid_indices, relative_variations,
+                               knee_index, analysis_length)
     
     @staticmethod
     def _find_knee_point(curve):
@@ -291,37 +534,34 @@ class Metrics:
         """
         if len(curve) < 3:
             return 0  # Return start if too short
-        
+
+        curve = np.asarray(curve, dtype=np.float64)
         n = len(curve)
-        
+
         # First point (0, curve[0]) and last point (n-1, curve[-1])
         x1, y1 = 0, curve[0]
         x2, y2 = n - 1, curve[-1]
-        
-        # Compute perpendicular distance for each point to the line
-        max_distance = -1
-        knee_idx = 0
-        
+
         # Line equation: (y2-y1)*x - (x2-x1)*y + (x2-x1)*y1 - (y2-y1)*x1 = 0
         # Distance = |ax + by + c| / sqrt(a^2 + b^2)
         a = y2 - y1
         b = -(x2 - x1)
         c = (x2 - x1) * y1 - (y2 - y1) * x1
-        
+
         denominator = math.sqrt(a*a + b*b)
         if denominator < 1e-10:
             # Line is horizontal or degenerate, no clear knee
             return 0
-        
-        # Find point with maximum distance
-        for i in range(1, n - 1):  # Skip first and last points
-            x, y = i, curve[i]
-            distance = abs(a * x + b * y + c) / denominator
-            
-            if distance > max_distance:
-                max_distance = distance
-                knee_idx = i
-        
+
+        # Perpendicular distance of every point to the line, in one vectorized pass
+        x = np.arange(n, dtype=np.float64)
+        distances = np.abs(a * x + b * curve + c) / denominator
+
+        # Find point with maximum distance (skip first and last points)
+        interior = distances[1:-1]
+        knee_idx = int(interior.argmax()) + 1
+        max_distance = float(interior[knee_idx - 1])
+
         # If the maximum distance is very small, the curve is nearly linear
         # In this case, consider the transient to be very short
         if max_distance < 0.01:  # Threshold for "nearly linear"
@@ -329,32 +569,6 @@ class Metrics:
         
         return knee_idx
     
-    @staticmethod
-    def _find_max_change_point(curve):
-        """Fallback method: find point with maximum rate of change decrease.
-        
-        Args:
-            curve: List of values
-        
-        Returns:
-            Index where the rate of change stabilizes most
-        """
-        if len(curve) < 3:
-            return 0
-        
-        # Compute second derivative (rate of change of rate of change)
-        second_derivative = []
-        for i in range(1, len(curve) - 1):
-            d2 = curve[i+1] - 2*curve[i] + curve[i-1]
-            second_derivative.append(abs(d2))
-        
-        if not second_derivative:
-            return 0
-        
-        # Find maximum change in curvature
-        max_idx = second_derivative.index(max(second_derivative))
-        return max_idx + 1  # Adjust for offset
-    
     @staticmethod
     def plot_transient_detection(metric_key='bin_success_rate', metric_name='Success Rate', 
                                   save_path=None):
@@ -365,25 +579,37 @@ class Metrics:
             metric_name: Human-readable name for the metric
             save_path: Path to save the plot (if None, displays interactive plot)
         """
-        # Filter valid bins
-        valid_bins = []
-        valid_indices = []
-        for i, b in enumerate(Metrics._bins):
-            if b['bin_successful_reservations'] + b['bin_failed_reservations'] > 0:
-                valid_bins.append(b)
-                valid_indices.append(i)
-        
-        if len(valid_bins) < 10:
-            logger.warning(f"Insufficient data to plot transient detection ({len(valid_bins)} bins)")
+        # Filter valid bins (single vectorized mask)
+        succ = Metrics.get_column('bin_successful_reservations')
+        fail = Metrics.get_column('bin_failed_reservations')
+        mask = (succ + fail) > 0
+        valid_indices = np.flatnonzero(mask)
+
+        if valid_indices.size < 10:
+            logger.warning(f"Insufficient data to plot transient detection ({valid_indices.size} bins)")
             return
-        
+
         # Get metric values and time
-        values = [b[metric_key] for b in valid_bins]
-        times_hours = [b['time'] / 60.0 for b in valid_bins]  # Convert minutes to hours
-        
-        # Detect transient phase
-        transient_end, steady_mean, steady_std, num_steady = Metrics.detect_transient_welch(metric_key)
-        
+        values = Metrics.get_column(metric_key)[mask]
+        times_hours = Metrics.get_column('time')[mask] / 60.0  # Convert minutes to hours
+
+        # Detect transient phase (keeping the intermediate curves for plot 2)
+        result = Metrics._detect_transient(metric_key)
+
+        # Agg backend when writing to file, no display needed
+        plt = _import_pyplot(headless=save_path is not None)
+        Metrics._plot_transient_core(plt, values, times_hours, valid_indices,
+                                     result, metric_name, save_path)
+
+    @staticmethod
+    def _plot_transient_core(plt, values, times_hours, valid_indices, result,
+                             metric_name, save_path):
+        """Render one transient detection figure from precomputed arrays."""
+        transient_end = result.transient_end
+        steady_mean = result.steady_mean
+        steady_std = result.steady_std
+        num_steady = result.num_steady_bins
+
         # Create figure
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
         
@@ -392,8 +618,9 @@ class Metrics:
         
         if transient_end is not None:
             # Find the index in valid_bins that corresponds to transient_end
-            transient_idx = valid_indices.index(transient_end) if transient_end in valid_indices else None
-            
+            match = np.flatnonzero(valid_indices == transient_end)
+            transient_idx = int(match[0]) if match.size else None
+
             if transient_idx is not None and transient_idx < len(times_hours):
                 # Mark transient region
                 ax1.axvspan(0, times_hours[transient_idx], alpha=0.2, color='red', 
@@ -420,29 +647,14 @@ class Metrics:
         
         # Plot 2: Relative variation curve (used for knee detection)
         if transient_end is not None:
-            # Recompute the relative variations EXACTLY as done in detection
-            n = len(values)
-            overall_mean = sum(values) / n
-            if abs(overall_mean) < 1e-10:
-                overall_mean = 1e-10
-            
-            # IMPORTANT: Match the detection algorithm - only analyze first portion
-            analysis_length = min(n, max(50, n // 2))
-            
-            min_valid_bins = 10
-            max_k = analysis_length - min_valid_bins
-            
-            relative_variations = []
-            for k in range(max_k):
-                # Use full dataset for truncated mean (just like detection)
-                truncated_data = values[k:]
-                x_k = sum(truncated_data) / len(truncated_data)
-                R_k = abs(x_k - overall_mean) / abs(overall_mean)
-                relative_variations.append(R_k)
-            
-            # Find knee point
-            knee_index = Metrics._find_knee_point(relative_variations)
-            
+            # Reuse the relative variations and knee computed by detection
+            relative_variations = result.relative_variations
+            knee_index = result.knee_index
+            analysis_length = result.analysis_length
+        else:
+            relative_variations = None
+
+        if relative_variations is not None:
             # Plot relative variation
             ax2.plot(range(len(relative_variations)), relative_variations, 'b-', linewidth=2,
                     label='Relative variation R_k')
@@ -482,18 +694,37 @@ class Metrics:
             save_dir: Directory to save plots
         """
         os.makedirs(save_dir, exist_ok=True)
-        
+
         metrics_to_plot = [
             ('bin_success_rate', 'Reservation Success Rate'),
             ('bin_avg_attempts', 'Average Attempts Before Success'),
             ('bin_utilization_rate', 'Car Utilization Rate'),
             ('bin_avg_trip_distance', 'Average Trip Distance (km/10)')
         ]
-        
+
+        # Shared prepass: valid-bin mask and time axis are identical for all
+        # four metrics, so compute them once instead of per plot
+        succ = Metrics.get_column('bin_successful_reservations')
+        fail = Metrics.get_column('bin_failed_reservations')
+        mask = (succ + fail) > 0
+        valid_indices = np.flatnonzero(mask)
+
+        if valid_indices.size < 10:
+            logger.warning(f"Insufficient data to plot transient detection ({valid_indices.size} bins)")
+            return
+
+        times_hours = Metrics.get_column('time')[mask] / 60.0
+
+        # Plots are always written to file here, so force the Agg backend once
+        plt = _import_pyplot(headless=True)
+
         for metric_key, metric_name in metrics_to_plot:
             save_path = os.path.join(save_dir, f'transient_{metric_key}.png')
-            Metrics.plot_transient_detection(metric_key, metric_name, save_path)
-        
+            values = Metrics.get_column(metric_key)[mask]
+            result = Metrics._detect_transient(metric_key)
+            Metrics._plot_transient_core(plt, values, times_hours, valid_indices,
+                                         result, metric_name, save_path)
+
         logger.info(f"All transient detection plots saved to {save_dir}/")
     
     @staticmethod
@@ -512,53 +743,60 @@ class Metrics:
         Returns:
             List of (start_bin, end_bin, mean, std) tuples for stationary windows
         """
-        valid_bins = [b for b in Metrics._bins 
-                     if b['bin_successful_reservations'] + b['bin_failed_reservations'] > 0]
-        
-        if len(valid_bins) < window_size:
+        succ = Metrics.get_column('bin_successful_reservations')
+        fail = Metrics.get_column('bin_failed_reservations')
+        metric_col = Metrics.get_column(metric_key)
+        mask = (succ + fail) > 0
+        values = metric_col[mask].astype(np.float64)
+        n = len(values)
+
+        if n < window_size:
             return []
-        
-        values = [b[metric_key] for b in valid_bins]
-        windows = []
-        
-        i = 0
-        while i <= len(values) - window_size:
-            # Check if this window is stationary
-            window = values[i:i+window_size]
-            mean = sum(window) / len(window)
-            variance = sum((x - mean)**2 for x in window) / len(window)
+
+        # Prefix sums of x and x² give O(1) mean/variance for any [i, j) range
+        cs = np.concatenate(([0.0], np.cumsum(values)))
+        cs2 = np.concatenate(([0.0], np.cumsum(values * values)))
+
+        def _range_stats(i, j):
+            """Mean, std and normalized variance over values[i:j] from prefix sums."""
+            count = j - i
+            mean = (cs[j] - cs[i]) / count
+            variance = max(0.0, (cs2[j] - cs2[i]) / count - mean * mean)
             std = math.sqrt(variance) if variance > 0 else 0.0
-            
             # Normalized variance (coefficient of variation squared)
             norm_var = (std / mean) if mean > 0.01 else variance
-            
-            if norm_var <= variance_threshold:
-                # This window is stationary, try to extend it
+            return mean, std, norm_var
+
+        # Vectorized stationarity test for every candidate base window
+        w = window_size
+        win_means = (cs[w:] - cs[:-w]) / w
+        win_vars = np.maximum(0.0, (cs2[w:] - cs2[:-w]) / w - win_means * win_means)
+        win_stds = np.sqrt(win_vars)
+        win_norm_vars = np.where(win_means > 0.01, win_stds / win_means, win_vars)
+        stationary_start = win_norm_vars <= variance_threshold
+
+        windows = []
+
+        i = 0
+        while i <= n - window_size:
+            if stationary_start[i]:
+                # This window is stationary, try to extend it one bin at a time
                 end = i + window_size
-                while end < len(values):
-                    # Try adding next bin
-                    extended = values[i:end+1]
-                    ext_mean = sum(extended) / len(extended)
-                    ext_var = sum((x - ext_mean)**2 for x in extended) / len(extended)
-                    ext_std = math.sqrt(ext_var) if ext_var > 0 else 0.0
-                    ext_norm_var = (ext_std / ext_mean) if ext_mean > 0.01 else ext_var
-                    
+                while end < n:
+                    _, _, ext_norm_var = _range_stats(i, end + 1)
                     if ext_norm_var <= variance_threshold:
                         end += 1
                     else:
                         break
-                
+
                 # Store window
-                window_vals = values[i:end]
-                win_mean = sum(window_vals) / len(window_vals)
-                win_var = sum((x - win_mean)**2 for x in window_vals) / len(window_vals)
-                win_std = math.sqrt(win_var) if win_var > 0 else 0.0
-                windows.append((i, end-1, win_mean, win_std))
-                
+                win_mean, win_std, _ = _range_stats(i, end)
+                windows.append((i, end - 1, float(win_mean), float(win_std)))
+
                 i = end  # Jump to end of stationary window
             else:
                 i += 1
-        
+
         return windows
 
     @staticmethod
@@ -576,32 +814,24 @@ class Metrics:
         Returns:
             (mean, half_width, lower, upper) or (None, None, None, None)
         """
-        bins_slice = Metrics._bins[start_bin:end_bin]
-        
+        succ = Metrics.get_column('bin_successful_reservations')[start_bin:end_bin]
+        fail = Metrics.get_column('bin_failed_reservations')[start_bin:end_bin]
+        metric_col = Metrics.get_column(metric_key)[start_bin:end_bin]
+
         # Filter out bins with no activity
-        valid_bins = [b for b in bins_slice 
-                     if b['bin_successful_reservations'] + b['bin_failed_reservations'] > 0]
-        
-        if len(valid_bins) < min_valid_bins:
+        values = metric_col[(succ + fail) > 0].astype(np.float64)
+
+        if len(values) < min_valid_bins:
             return None, None, None, None
-        
-        values = [b[metric_key] for b in valid_bins]
+
         n = len(values)
-        mean = sum(values) / n
-        variance = sum((x - mean)**2 for x in values) / (n - 1) if n > 1 else 0.0
+        mean = float(values.mean())
+        variance = float(values.var(ddof=1)) if n > 1 else 0.0
         std_err = math.sqrt(variance / n) if n > 0 else 0.0
         
         # Use t-distribution for small samples
-        # Approximate critical value for common confidence levels
-        if confidence == 0.95:
-            t_critical = 1.96 if n >= 30 else 2.0 + (30 - n) * 0.1 / 30  # rough approximation
-        elif confidence == 0.90:
-            t_critical = 1.645 if n >= 30 else 1.8
-        elif confidence == 0.99:
-            t_critical = 2.576 if n >= 30 else 3.0
-        else:
-            t_critical = 2.0  # fallback
-        
+        t_critical = _t_critical(n, confidence)
+
         half_width = t_critical * std_err
         lower = mean - half_width
         upper = mean + half_width
@@ -629,55 +859,59 @@ class Metrics:
         # Group bins by their phase in the cycle
         bins_per_cycle = max(1, cycle_length_minutes // BIN_INTERVAL)
         
-        # Organize bins by cycle phase
-        phase_bins = {}  # phase_index -> [bin_data]
-        
-        for b in Metrics._bins:
-            if b['bin_successful_reservations'] + b['bin_failed_reservations'] > 0:
-                # Determine which phase of the cycle this bin belongs to
-                bin_time = b['time']
-                phase = int((bin_time % cycle_length_minutes) // BIN_INTERVAL) % bins_per_cycle
-                
-                if phase not in phase_bins:
-                    phase_bins[phase] = []
-                phase_bins[phase].append(b)
-        
-        # Compute CI for each phase
+        # The activity mask, phase indices and per-phase counts depend only on
+        # the bin layout, not the metric — cache them so sweeping several
+        # metric_keys over the same bins skips the phase arithmetic
+        cache_key = (cycle_length_minutes, BIN_INTERVAL, Metrics._bin_count)
+        cached = Metrics._cycle_phase_cache
+        if cached is not None and cached[0] == cache_key:
+            _, mask, phases = cached
+        else:
+            succ = Metrics.get_column('bin_successful_reservations')
+            fail = Metrics.get_column('bin_failed_reservations')
+            mask = (succ + fail) > 0
+            times = Metrics.get_column('time')[mask]
+            phases = ((times % cycle_length_minutes) // BIN_INTERVAL).astype(np.int64) % bins_per_cycle
+            Metrics._cycle_phase_cache = (cache_key, mask, phases)
+
+        values = Metrics.get_column(metric_key)[mask].astype(np.float64)
+
+        if values.size == 0:
+            return {}
+
+        # Per-phase sum, sum of squares and count come out of one fused scan
+        # (jitted when numba is available)
+        sums, sumsqs, counts = _cycle_phase_sums(phases, values, bins_per_cycle)
+
+        # Compute CI for each phase with at least 3 samples
         results = {}
-        for phase, bins_in_phase in sorted(phase_bins.items()):
-            if len(bins_in_phase) >= 3:  # Need at least 3 samples
-                values = [b[metric_key] for b in bins_in_phase]
-                n = len(values)
-                mean = sum(values) / n
-                variance = sum((x - mean)**2 for x in values) / (n - 1) if n > 1 else 0.0
-                std_err = math.sqrt(variance / n) if n > 0 else 0.0
-                
-                # t-critical value
-                if confidence == 0.95:
-                    t_critical = 1.96 if n >= 30 else 2.0 + (30 - n) * 0.1 / 30
-                elif confidence == 0.90:
-                    t_critical = 1.645 if n >= 30 else 1.8
-                elif confidence == 0.99:
-                    t_critical = 2.576 if n >= 30 else 3.0
-                else:
-                    t_critical = 2.0
-                
-                half_width = t_critical * std_err
-                lower = mean - half_width
-                upper = mean + half_width
-                
-                # Store phase time for reporting
-                phase_time_minutes = phase * BIN_INTERVAL
-                results[phase] = {
-                    'phase_time_minutes': phase_time_minutes,
-                    'mean': mean,
-                    'half_width': half_width,
-                    'lower': lower,
-                    'upper': upper,
-                    'n_samples': n,
-                    'std': math.sqrt(variance) if variance > 0 else 0.0
-                }
-        
+        for phase in np.flatnonzero(counts >= 3):
+            phase = int(phase)
+            n = int(counts[phase])
+            mean = sums[phase] / n
+            variance = (max(0.0, (sumsqs[phase] - n * mean * mean) / (n - 1))
+                        if n > 1 else 0.0)
+            std_err = math.sqrt(variance / n) if n > 0 else 0.0
+
+            # t-critical value
+            t_critical = _t_critical(n, confidence)
+
+            half_width = t_critical * std_err
+            lower = mean - half_width
+            upper = mean + half_width
+
+            # Store phase time for reporting
+            phase_time_minutes = phase * BIN_INTERVAL
+            results[phase] = {
+                'phase_time_minutes': phase_time_minutes,
+                'mean': float(mean),
+                'half_width': half_width,
+                'lower': float(lower),
+                'upper': float(upper),
+                'n_samples': n,
+                'std': math.sqrt(variance) if variance > 0 else 0.0
+            }
+
         return results
     
     @staticmethod
@@ -717,16 +951,22 @@ class Metrics:
         return Metrics._total_attempts_before_success / Metrics._successful_reservations
     
     @staticmethod
+    def _compute_car_time_totals():
+        """Return (total_in_use, total_charging, total_idle) across the fleet.
+
+        Reduces the per-car SoA time buffers with vectorized sums instead of
+        a Python-level loop over Car.cars."""
+        Car = _car_cls()
+        n = len(Car.cars)
+        return (float(Car._in_use_time_arr[:n].sum()),
+                float(Car._charging_time_arr[:n].sum()),
+                float(Car._idle_time_arr[:n].sum()))
+
     @staticmethod
     def get_car_utilization_rate():
         """Get fraction of time cars spent being used vs total time"""
-        from .Entities.Car import Car
-        
-        total_in_use = 0.0
-        total_time = 0.0
-        for car in Car.cars:
-            total_in_use += car.in_use_time
-            total_time += car.in_use_time + car.charging_time + car.idle_time
+        total_in_use, total_charging, total_idle = Metrics._compute_car_time_totals()
+        total_time = total_in_use + total_charging + total_idle
 
         if total_time == 0:
             return 0.0
@@ -735,17 +975,22 @@ class Metrics:
     @staticmethod
     def get_charging_rate():
         """Get fraction of time cars spent charging vs total time"""
-        from .Entities.Car import Car
-        
-        total_charging = 0.0
-        total_time = 0.0
-        for car in Car.cars:
-            total_charging += car.charging_time
-            total_time += car.in_use_time + car.charging_time + car.idle_time
-        
+        total_in_use, total_charging, total_idle = Metrics._compute_car_time_totals()
+        total_time = total_in_use + total_charging + total_idle
+
         if total_time == 0:
             return 0.0
         return total_charging / total_time
+
+    @staticmethod
+    def get_idle_rate():
+        """Get fraction of time cars spent idle vs total time"""
+        total_in_use, total_charging, total_idle = Metrics._compute_car_time_totals()
+        total_time = total_in_use + total_charging + total_idle
+
+        if total_time == 0:
+            return 0.0
+        return total_idle / total_time
     
     @staticmethod
     def get_average_queue_length():
@@ -757,40 +1002,50 @@ class Metrics:
     @staticmethod
     def print_metrics():
         """Print a comprehensive metrics report"""
-        logger.info("\nSIMULATION METRICS REPORT")
-        logger.info("=" * 40)
-        logger.info(f"Reservation Success Rate: {Metrics.get_reservation_success_rate()*100:.1f}%")
-        logger.info(f"Total Reservations: {Metrics._successful_reservations + Metrics._failed_reservations}")
-        logger.info(f"Average Walking Time: {format_duration(Metrics.get_average_walking_time())}")
-        logger.info(f"Average Attempts Before Success: {Metrics.get_average_attempts_before_success():.2f}")
-        logger.info(f"\nTrip Statistics:")
-        logger.info(f"Total Trips: {Metrics._total_trips}")
-        logger.info(f"Average Trip Distance: {format_distance(Metrics.get_average_trip_distance())}")
-        logger.info(f"Total Distance Traveled: {format_distance(Metrics._total_trip_distance)}")
-        logger.info(f"\nCar Utilization:")
-        logger.info(f"In-Use Rate: {Metrics.get_car_utilization_rate()*100:.1f}%")
-        logger.info(f"Charging Rate: {Metrics.get_charging_rate()*100:.1f}%")
-        logger.info(f"Idle Rate: {(1-Metrics.get_car_utilization_rate()-Metrics.get_charging_rate())*100:.1f}%")
-        logger.info(f"\nCharging Statistics:")
-        logger.info(f"Total Charging Sessions: {Metrics._total_charging_sessions}")
-        logger.info(f"Average Queue Length: {Metrics.get_average_queue_length():.2f}")
+        # Build the whole report in a buffer and emit it with a single
+        # logger call instead of ~30 separate records
+        lines = []
+        add = lines.append
+        add("\nSIMULATION METRICS REPORT")
+        add("=" * 40)
+        add(f"Reservation Success Rate: {Metrics.get_reservation_success_rate()*100:.1f}%")
+        add(f"Total Reservations: {Metrics._successful_reservations + Metrics._failed_reservations}")
+        add(f"Average Walking Time: {format_duration(Metrics.get_average_walking_time())}")
+        add(f"Average Attempts Before Success: {Metrics.get_average_attempts_before_success():.2f}")
+        add(f"\nTrip Statistics:")
+        add(f"Total Trips: {Metrics._total_trips}")
+        add(f"Average Trip Distance: {format_distance(Metrics.get_average_trip_distance())}")
+        add(f"Total Distance Traveled: {format_distance(Metrics._total_trip_distance)}")
+        # Bind the rates once; each getter reduces the fleet time buffers
+        util_rate = Metrics.get_car_utilization_rate()
+        charging_rate = Metrics.get_charging_rate()
+        add(f"\nCar Utilization:")
+        add(f"In-Use Rate: {util_rate*100:.1f}%")
+        add(f"Charging Rate: {charging_rate*100:.1f}%")
+        add(f"Idle Rate: {(1-util_rate-charging_rate)*100:.1f}%")
+        add(f"\nCharging Statistics:")
+        add(f"Total Charging Sessions: {Metrics._total_charging_sessions}")
+        add(f"Average Queue Length: {Metrics.get_average_queue_length():.2f}")
+
+        generate_plots = False
         
         # Print binning analysis if bins were collected
-        if Metrics._bins:
+        if Metrics._bin_count > 0:
             # Exclude the last bin as it may be incomplete (simulation ended mid-interval)
-            bins_to_analyze = Metrics._bins[:-1] if len(Metrics._bins) > 1 else Metrics._bins
-            
-            # Count valid bins (those with activity)
-            valid_bins = [b for b in bins_to_analyze 
-                         if b['bin_successful_reservations'] + b['bin_failed_reservations'] > 0]
-            
-            logger.info(f"\n" + "=" * 40)
-            logger.info(f"STATISTICAL ANALYSIS ({len(bins_to_analyze)} bins analyzed, {len(valid_bins)} with activity, 1 incomplete bin excluded)")
-            logger.info("=" * 40)
-            
-            if len(valid_bins) < 10:
-                logger.info("⚠ Warning: Insufficient bins with activity for reliable statistical analysis")
-                logger.info(f"  Recommendation: Increase simulation time or user arrival rate")
+            end = Metrics._bin_count - 1 if Metrics._bin_count > 1 else Metrics._bin_count
+
+            # Count valid bins (those with activity) with one vectorized mask
+            succ = Metrics.get_column('bin_successful_reservations')[:end]
+            fail = Metrics.get_column('bin_failed_reservations')[:end]
+            num_valid = int(np.count_nonzero((succ + fail) > 0))
+
+            add(f"\n" + "=" * 40)
+            add(f"STATISTICAL ANALYSIS ({end} bins analyzed, {num_valid} with activity, 1 incomplete bin excluded)")
+            add("=" * 40)
+
+            if num_valid < 10:
+                add("⚠ Warning: Insufficient bins with activity for reliable statistical analysis")
+                add(f"  Recommendation: Increase simulation time or user arrival rate")
             else:
                 # Import config to check system type
                 from . import config
@@ -798,10 +1053,10 @@ class Metrics:
                 
                 if system_type == 'STATIONARY':
                     # STATIONARY SYSTEM: Focus on transient detection
-                    logger.info(f"\n🔍 STATIONARY SYSTEM ANALYSIS")
-                    logger.info(f"Focus: Automated transient phase detection")
-                    logger.info("-" * 40)
-                    
+                    add(f"\n🔍 STATIONARY SYSTEM ANALYSIS")
+                    add(f"Focus: Automated transient phase detection")
+                    add("-" * 40)
+
                     for metric_key, metric_name in [
                         ('bin_success_rate', 'Reservation Success Rate'),
                         ('bin_avg_attempts', 'Average Attempts Before Success'),
@@ -810,25 +1065,25 @@ class Metrics:
                     ]:
                         transient_end, steady_mean, steady_std, steady_bins = Metrics.detect_transient_welch(metric_key)
                         if transient_end is not None:
-                            transient_time = Metrics._bins[transient_end]['time'] if transient_end < len(Metrics._bins) else 0
-                            logger.info(f"\n{metric_name}:")
-                            logger.info(f"  ⏱ Transient phase: bins 0-{transient_end} "
-                                       f"({format_duration(transient_time)})")
-                            logger.info(f"  📊 Steady-state mean: {steady_mean:.4f}")
-                            logger.info(f"  📈 Steady-state std: {steady_std:.4f}")
-                            logger.info(f"  ✓ Steady-state bins: {steady_bins}")
+                            transient_time = Metrics.get_column('time')[transient_end] if transient_end < Metrics._bin_count else 0
+                            add(f"\n{metric_name}:")
+                            add(f"  ⏱ Transient phase: bins 0-{transient_end} "
+                                f"({format_duration(transient_time)})")
+                            add(f"  📊 Steady-state mean: {steady_mean:.4f}")
+                            add(f"  📈 Steady-state std: {steady_std:.4f}")
+                            add(f"  ✓ Steady-state bins: {steady_bins}")
                         else:
-                            logger.info(f"\n{metric_name}: Insufficient data for transient detection")
-                    
-                    # Generate transient detection plots
-                    logger.info(f"\n📊 Generating transient detection plots...")
-                    Metrics.plot_all_metrics_transient(save_dir='transient_plots')
-                
+                            add(f"\n{metric_name}: Insufficient data for transient detection")
+
+                    # Plots are generated after the report is emitted
+                    add(f"\n📊 Generating transient detection plots...")
+                    generate_plots = True
+
                 elif system_type == 'CYCLE_STATIONARY':
                     # CYCLE-STATIONARY SYSTEM: Focus on confidence intervals
-                    logger.info(f"\n📈 CYCLE-STATIONARY SYSTEM ANALYSIS")
-                    logger.info(f"Focus: Confidence intervals for time-varying metrics")
-                    logger.info("-" * 40)
+                    add(f"\n📈 CYCLE-STATIONARY SYSTEM ANALYSIS")
+                    add(f"Focus: Confidence intervals for time-varying metrics")
+                    add("-" * 40)
                     
                     for metric_key, metric_name, display_multiplier in [
                         ('bin_success_rate', 'Success Rate', 100),  # Display as percentage
@@ -838,7 +1093,7 @@ class Metrics:
                         cycle_intervals = Metrics.compute_cycle_stationary_intervals(metric_key)
                         
                         if cycle_intervals:
-                            logger.info(f"\n{metric_name} by Time-of-Day (24h cycle):")
+                            add(f"\n{metric_name} by Time-of-Day (24h cycle):")
                             for phase in sorted(cycle_intervals.keys()):
                                 data = cycle_intervals[phase]
                                 phase_time = data['phase_time_minutes']
@@ -855,14 +1110,35 @@ class Metrics:
                                     upper_disp = data['upper']
                                     unit = ''
                                 
-                                logger.info(f"  Phase {phase} (~{hours:02d}:00): "
-                                           f"mean={mean_disp:.2f}{unit}, "
-                                           f"95% CI=[{lower_disp:.2f}, {upper_disp:.2f}]{unit}, "
-                                           f"n={data['n_samples']}")
+                                add(f"  Phase {phase} (~{hours:02d}:00): "
+                                    f"mean={mean_disp:.2f}{unit}, "
+                                    f"95% CI=[{lower_disp:.2f}, {upper_disp:.2f}]{unit}, "
+                                    f"n={data['n_samples']}")
                         else:
-                            logger.info(f"\n{metric_name}: Insufficient samples for cycle analysis")
-        
-        logger.info("=" * 40)
+                            add(f"\n{metric_name}: Insufficient samples for cycle analysis")
+
+        add("=" * 40)
+        logger.info("\n".join(lines))
+
+        if generate_plots:
+            # Figure rendering takes hundreds of ms per plot; hand the job
+            # to a worker process so reporting returns immediately. Callers
+            # that need the files can block on wait_for_plots().
+            from concurrent.futures import ProcessPoolExecutor
+
+            columns = {key: Metrics.get_column(key).copy()
+                       for key in Metrics._BIN_KEYS}
+            Metrics._plot_pool = ProcessPoolExecutor(max_workers=1)
+            Metrics._plot_pool.submit(
+                _plot_metrics_job, columns, Metrics._bin_count, 'transient_plots'
+            )
+
+    @staticmethod
+    def wait_for_plots():
+        """Block until background plot generation (if any) has finished."""
+        if Metrics._plot_pool is not None:
+            Metrics._plot_pool.shutdown(wait=True)
+            Metrics._plot_pool = None
 
     @staticmethod
     def get_summary_dict():
@@ -875,6 +1151,7 @@ class Metrics:
         idle_rate = max(0.0, 1 - in_use_rate - charging_rate)
         avg_queue = Metrics.get_average_queue_length()
         avg_attempts = Metrics.get_average_attempts_before_success()
+        avg_walking = Metrics.get_average_walking_time()
 
         return {
             # raw values
@@ -884,7 +1161,7 @@ class Metrics:
             # Output-only scaling: divide reported km by 10 (logic/internal values unchanged)
             "average_trip_distance_km": avg_trip_km / 10.0,
             "total_distance_traveled_km": total_trip_km / 10.0,
-            "average_walking_time_minutes": Metrics.get_average_walking_time(),
+            "average_walking_time_minutes": avg_walking,
             "average_attempts_before_success": avg_attempts,
             "in_use_rate": in_use_rate,  # 0..1
             "charging_rate": charging_rate,  # 0..1
@@ -896,7 +1173,7 @@ class Metrics:
             "reservation_success_rate_pct_str": f"{success_rate*100:.1f}%",
             "average_trip_distance_str": format_distance(avg_trip_km),
             "total_distance_traveled_str": format_distance(total_trip_km),
-            "average_walking_time_str": format_duration(Metrics.get_average_walking_time()),
+            "average_walking_time_str": format_duration(avg_walking),
             "average_attempts_before_success_str": f"{avg_attempts:.2f}",
             "in_use_rate_pct_str": f"{in_use_rate*100:.1f}%",
             "charging_rate_pct_str": f"{charging_rate*100:.1f}%",
@@ -911,18 +1188,30 @@ class Metrics:
         Also logs a single-line JSON with a recognizable prefix for easy scraping.
         """
         target = path or os.environ.get("SIM_SUMMARY_JSON")
+
+        # Nothing to write and the log line would be dropped anyway:
+        # skip building the summary entirely
+        log_json = logger.isEnabledFor(logging.INFO)
+        if not target and not log_json:
+            return
+
         summary = Metrics.get_summary_dict()
 
         # Log a single-line machine-readable entry
-        try:
-            logger.info("METRICS_JSON %s", json.dumps(summary, separators=(",", ":")))
-        except Exception:
-            pass
+        if log_json:
+            try:
+                logger.info("METRICS_JSON %s", _dumps_compact(summary))
+            except Exception:
+                pass
 
         if not target:
             return
         try:
-            with open(target, "w", encoding="utf-8") as f:
-                json.dump(summary, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                with open(target, "wb") as f:
+                    f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+            else:
+                with open(target, "w", encoding="utf-8") as f:
+                    json.dump(summary, f, ensure_ascii=False, indent=2)
         except Exception as e:
             logger.warning(f"Failed to write summary JSON to {target}: {e}")
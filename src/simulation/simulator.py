@@ -3,11 +3,12 @@ Discrete Event Simulation for Car Sharing System.
 Main simulator class and execution logic.
 """
 
-import queue
+import heapq
+import itertools
 from . import config
 from .metrics import Metrics
 from .visualization import SimulationVisualizer
-from .events import user_subscription_event, bin_collection_event
+from .events import EventType, EVENT_HANDLERS
 from .Entities import Car as car_mod
 from .infrastructure import charging_station as charging_station_mod
 from .Entities import car_relocator as car_relocator_mod
@@ -19,28 +20,79 @@ class Simulator:
     
     def __init__(self):
         """Initialize the simulator with empty FES and logger."""
-        self.FES = queue.PriorityQueue()
+        # Plain heap instead of queue.PriorityQueue: the loop is
+        # single-threaded, so the thread-safety locks are pure overhead
+        self.FES = []
+        self._event_seq = itertools.count()
+        self._cancelled = set()
+        self.end_time = float('inf')
         self.logger = config.logger
         self.road_map = None
         self.visualizer = None
-    
-    def schedule_event(self, event_time, event_function, payload):
+
+    def schedule_event(self, event_time, event_type, payload):
         """Schedule an event to occur at a specific time.
-        
+
         Args:
             event_time: Time when event should occur
-            event_function: Function to call for this event
+            event_type: EventType code selecting the handler in EVENT_HANDLERS
             payload: Data to pass to event function
+
+        Returns:
+            Event id usable with cancel(), or None if the event was dropped
         """
-        self.FES.put((event_time, event_function, payload))
-    
+        # Events past the horizon would only be popped and discarded at the
+        # cutoff; don't let them grow the heap at all
+        if event_time > self.end_time:
+            return None
+
+        # The sequence number breaks ties on event_time; storing a small
+        # int code instead of a function object keeps the tuples compact.
+        # It doubles as the event id handed back for cancellation.
+        event_id = next(self._event_seq)
+        heapq.heappush(self.FES, (event_time, event_id, event_type, payload))
+        return event_id
+
+    def cancel(self, event_id):
+        """Cancel a previously scheduled event by its id.
+
+        The heap entry is not removed; it is marked as a tombstone and
+        skipped lazily when popped, so cancellation costs O(1) instead of
+        an O(n) scan plus re-heapify.
+
+        Args:
+            event_id: Id returned by schedule_event
+        """
+        self._cancelled.add(event_id)
+
+    def schedule_events(self, entries):
+        """Schedule a batch of events in one go.
+
+        Extending the heap and re-heapifying once is O(n), cheaper than n
+        individual heappush calls at O(n log n).
+
+        Args:
+            entries: Iterable of (event_time, event_type, payload) tuples
+        """
+        seq = self._event_seq
+        fes = self.FES
+        for event_time, event_type, payload in entries:
+            fes.append((event_time, next(seq), event_type, payload))
+        heapq.heapify(fes)
+
     def get_next_event(self):
-        """Retrieve the next event from the FES.
-        
+        """Retrieve the next non-cancelled event from the FES.
+
         Returns:
-            Tuple of (event_time, event_function, payload)
+            Tuple of (event_time, event_id, event_type, payload)
         """
-        return self.FES.get()
+        cancelled = self._cancelled
+        while True:
+            event = heapq.heappop(self.FES)
+            if event[1] in cancelled:
+                cancelled.discard(event[1])
+                continue
+            return event
     
     def _initialize_entities(self):
         """Initialize all simulation entities."""
@@ -74,16 +126,35 @@ class Simulator:
             self.visualizer = SimulationVisualizer(self.road_map)
             self.logger.info("Visualization enabled")
     
-    def _schedule_initial_events(self):
-        """Schedule the initial events to start the simulation."""
-        # Schedule first user arrival
-        self.schedule_event(0, user_subscription_event, ())
-        
-        # Schedule first bin collection if enabled
+    def _schedule_initial_events(self, end_time):
+        """Schedule the initial events to start the simulation.
+
+        Args:
+            end_time: Simulation end time in minutes
+        """
+        # Schedule first user arrival. Arrivals cannot be pre-generated in a
+        # batch: each inter-arrival draw depends on the time-varying rate and
+        # on the MAX_USERS cutoff, so the chain stays event-driven.
+        self.schedule_event(0, EventType.USER_SUBSCRIPTION, ())
+
+        # Bin collection times are deterministic (every BIN_INTERVAL), so
+        # schedule the whole series up front in one batch
         if config.ENABLE_BINNING:
-            self.schedule_event(config.BIN_INTERVAL, bin_collection_event, ())
+            bin_interval = config.BIN_INTERVAL
+            self.schedule_events(
+                (t, EventType.BIN_COLLECTION, None)
+                for t in range(bin_interval, int(end_time) + 1, bin_interval)
+            )
             self.logger.info(
-                f"Binning enabled: snapshots every {config.BIN_INTERVAL} minutes"
+                f"Binning enabled: snapshots every {bin_interval} minutes"
+            )
+
+        # Schedule periodic visualization updates instead of redrawing
+        # after every event in the main loop
+        if self.visualizer:
+            self.schedule_event(
+                config.VISUALIZATION_UPDATE_INTERVAL * 60,
+                EventType.VISUALIZATION_UPDATE, None
             )
     
     def simulate(self, end_time):
@@ -93,30 +164,44 @@ class Simulator:
             end_time: Simulation end time in minutes
         """
         current_time = 0
-        
+        self.end_time = end_time
+
         # Initialize all components
         self._initialize_entities()
         self._initialize_visualization()
-        self._schedule_initial_events()
+        self._schedule_initial_events(end_time)
         
         self.logger.info(f"Starting simulation (end time: {end_time} minutes)")
         
-        # Main event loop
-        while not self.FES.empty():
-            event_time, event_function, payload = self.get_next_event()
-            
-            # Stop if we've passed end time
+        # Main event loop. Bind the heap pop, FES list and dispatch table
+        # to locals once so each iteration skips the attribute lookups.
+        pop = heapq.heappop
+        fes = self.FES
+        handlers = EVENT_HANDLERS
+        cancelled = self._cancelled
+        while fes:
+            # Peek the heap top and stop before popping once past end time,
+            # leaving the remaining events in place
+            event_time = fes[0][0]
             if event_time > end_time:
                 break
-            
+
             current_time = event_time
-            
-            # Execute event
-            event_function(current_time, payload, self)
-            
-            # Update visualization if enabled
-            if self.visualizer:
-                self.visualizer.update(current_time)
+
+            # Drain every event sharing this timestamp and dispatch them in
+            # a tight loop; the sequence tiebreaker preserves FIFO order
+            # within the tick
+            batch = [pop(fes)]
+            while fes and fes[0][0] == event_time:
+                batch.append(pop(fes))
+
+            for _, event_id, event_type, payload in batch:
+                # Cancelled events stay in the heap as tombstones and are
+                # skipped here when they surface
+                if event_id in cancelled:
+                    cancelled.discard(event_id)
+                    continue
+                handlers[event_type](current_time, payload, self)
         
         self.logger.info(f"Simulation completed at time {current_time:.2f}")
 
@@ -134,6 +219,9 @@ def run():
     Metrics.print_metrics()
     Metrics.export_summary_json()
 
+    # Plot generation runs in a background process; join it before exiting
+    Metrics.wait_for_plots()
+
 
 if __name__ == "__main__":
     run()
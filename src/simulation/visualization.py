@@ -3,7 +3,19 @@ Visualization module for the car sharing simulation.
 Handles all matplotlib-based real-time visualization.
 """
 
+import os
+
+import matplotlib
+
+# Select the raster-only Agg backend for headless runs (batch sweeps, CI)
+# so no GUI event loop is driven; must happen before pyplot is imported
+if not os.environ.get('DISPLAY'):
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 from matplotlib.patches import Rectangle
 from . import config
 from .Entities import Car as car_mod
@@ -20,9 +32,13 @@ class SimulationVisualizer:
         Args:
             road_map: RoadMap instance to visualize
         """
-        plt.rcParams['font.sans-serif'] = ['WOFF2']
         self.road_map = road_map
-        self.legend_created = False
+
+        # Config values used every frame, hoisted to instance attributes so
+        # the hot paths skip the module-global lookups
+        self._car_color_table = np.asarray(config.CAR_COLOR_TABLE)
+        self._relocator_busy_color = config.RELOCATOR_COLORS["busy"]
+        self._relocator_available_color = config.RELOCATOR_COLORS["available"]
         
         # Create figure and axes
         self.fig, self.ax = plt.subplots(
@@ -34,39 +50,67 @@ class SimulationVisualizer:
         self.ax.set_xlabel("X (km)")
         self.ax.set_ylabel("Y (km)")
         
-        # Draw static elements
+        # Draw static elements. Station markers never move, so they are
+        # drawn once here and captured in the blit background.
         self._draw_road_network()
         self._draw_traffic_zones()
-        
-        # Text annotations for dynamic elements
-        self.car_texts = []
-        self.station_texts = []
-        self.relocator_texts = []
-        
-        # Enable interactive mode
-        plt.ion()
-        plt.show()
+        self._draw_charging_stations()
+        self._create_legend()
+
+        # Persistent dynamic artists, mutated in place on each update.
+        # animated=True keeps them out of the static background; they are
+        # redrawn explicitly per frame. One PathCollection per entity type
+        # replaces the per-entity text artists: status is conveyed by color,
+        # so the whole fleet is a single C-level draw.
+        self.car_scatter = self.ax.scatter(
+            [], [], s=100, marker='o', edgecolors='black', linewidths=0.5,
+            animated=True
+        )
+        self.relocator_scatter = self.ax.scatter(
+            [], [], s=80, marker='s', edgecolors='black', linewidths=0.5,
+            animated=True
+        )
+        self.time_text = self.ax.text(
+            0.02, 0.98, "", transform=self.ax.transAxes,
+            ha="left", va="top", fontsize=10, animated=True
+        )
+
+        # Interactive window when a display is available; otherwise frames
+        # are dumped to disk from update()
+        self._headless = matplotlib.get_backend().lower() == 'agg'
+        if self._headless:
+            os.makedirs('frames', exist_ok=True)
+        else:
+            plt.ion()
+            plt.show()
+
+        # Render the static scene once and snapshot it as the blitting
+        # background; per-frame updates restore it instead of redrawing
+        # the road network, zones and stations
+        self.fig.canvas.draw()
+        self._background = self.fig.canvas.copy_from_bbox(self.ax.bbox)
     
     def _draw_road_network(self):
-        """Draw the road network on the visualization."""
+        """Draw the road network on the visualization.
+
+        All edges go into one LineCollection and all nodes into one scatter
+        call, so the whole network is two artists instead of one per
+        edge/node."""
         nodes_data, edges_data = self.road_map.get_road_network_data()
-        
+
         # Draw edges (roads)
-        for edge in edges_data:
-            start_x, start_y = edge["start"]
-            end_x, end_y = edge["end"]
-            self.ax.plot(
-                [start_x, end_x], [start_y, end_y],
-                "k-", alpha=0.3, linewidth=0.5
-            )
-        
+        segments = [[edge["start"], edge["end"]] for edge in edges_data]
+        self.ax.add_collection(LineCollection(
+            segments, colors="k", alpha=0.3, linewidths=0.5
+        ))
+
         # Draw nodes with color based on traffic factor
-        for node in nodes_data:
-            color = self._get_node_color(node["traffic_factor"])
-            self.ax.scatter(
-                node["x"], node["y"],
-                c=color, s=20, alpha=0.6
-            )
+        self.ax.scatter(
+            [node["x"] for node in nodes_data],
+            [node["y"] for node in nodes_data],
+            c=[self._get_node_color(node["traffic_factor"]) for node in nodes_data],
+            s=20, alpha=0.6
+        )
     
     def _get_node_color(self, traffic_factor):
         """Determine node color based on traffic factor."""
@@ -105,118 +149,109 @@ class SimulationVisualizer:
     
     def update(self, current_time):
         """Update visualization with current simulation state.
-        
+
+        Restores the cached static background and redraws only the dynamic
+        artists (blitting), skipping the full-canvas rasterization of the
+        road network on every frame.
+
         Args:
             current_time: Current simulation time in minutes
         """
-        # Clear previous dynamic elements
-        for txt in self.car_texts + self.station_texts + self.relocator_texts:
-            txt.remove()
-        self.car_texts.clear()
-        self.station_texts.clear()
-        self.relocator_texts.clear()
-        
-        # Update cars
+        canvas = self.fig.canvas
+        canvas.restore_region(self._background)
+
+        # Mutate the persistent artists in place
         self._update_cars()
-        
-        # Update charging stations
-        self._update_charging_stations()
-        
-        # Update relocators
         self._update_relocators()
-        
-        # Create legend if not already created
-        if not self.legend_created:
-            self._create_legend()
-        
-        # Update title with current time
-        self.ax.set_title(f"Car Positions and Stations - Time {current_time:.2f}")
-        
-        # Refresh display
-        self.fig.canvas.draw()
-        self.fig.canvas.flush_events()
-    
-    def _update_cars(self):
-        """Update car positions and colors based on status."""
-        car_xs, car_ys, car_colors = [], [], []
-        
-        for car in car_mod.Car.cars:
-            car_xs.append(car.location[0])
-            car_ys.append(car.location[1])
-            car_colors.append(self._get_car_color(car.status))
-        
-        # Draw cars as scatter plot
-        if car_xs:
-            self.ax.scatter(
-                car_xs, car_ys,
-                c=car_colors, s=100, marker='o',
-                edgecolors='black', linewidths=0.5
-            )
-        
-        # Add car icons
-        for car in car_mod.Car.cars:
-            icon = self._get_car_icon(car.status)
-            txt = self.ax.text(
-                car.location[0], car.location[1], icon,
-                ha="center", va="center",
-                fontsize=12, color="black"
+        self.time_text.set_text(f"Time {current_time:.2f}")
+
+        # Redraw only the dynamic artists over the restored background
+        ax = self.ax
+        ax.draw_artist(self.car_scatter)
+        ax.draw_artist(self.relocator_scatter)
+        ax.draw_artist(self.time_text)
+
+        canvas.blit(ax.bbox)
+        if self._headless:
+            # Write the composed buffer straight to disk; savefig would
+            # re-rasterize the whole scene and skip the animated artists
+            matplotlib.image.imsave(
+                os.path.join('frames', f'frame_{current_time:08.2f}.png'),
+                np.asarray(canvas.buffer_rgba())
             )
-            self.car_texts.append(txt)
-    
-    def _get_car_color(self, status):
-        """Get color for car based on status."""
-        return config.CAR_COLORS.get(status, "gray")
-    
-    def _get_car_icon(self, status):
-        """Get icon for car based on status."""
-        if status == "discharged":
-            return config.DISCHARGED_CAR_ICON
-        elif status == "charging":
-            return config.CHARGING_CAR_ICON
-        elif status == "needs_charging":
-            return config.NEEDS_CHARGING_CAR_ICON
         else:
-            return config.CAR_ICON
+            canvas.flush_events()
+
+    def _update_cars(self):
+        """Update car positions and colors based on status."""
+        cars = car_mod.Car.cars
+        n = len(cars)
+        if n == 0:
+            return
+
+        # Coordinates come straight out of the SoA buffers the Car class
+        # keeps in sync, instead of a per-car attribute walk
+        xy = np.column_stack((car_mod.Car._x_arr[:n], car_mod.Car._y_arr[:n]))
+        self.car_scatter.set_offsets(xy)
+        self.car_scatter.set_facecolor(
+            self._car_color_table[car_mod.Car._status_code_arr[:n]]
+        )
     
-    def _update_charging_stations(self):
-        """Update charging station positions."""
+    def _draw_charging_stations(self):
+        """Draw charging station markers (static, part of the background)."""
         for station in charging_station_mod.ChargingStation.stations:
-            txt = self.ax.text(
+            self.ax.text(
                 station.location[0], station.location[1],
                 config.CHARGING_STATION_ICON,
                 ha="center", va="center",
                 fontsize=16, color=config.CHARGING_STATION_COLOR
             )
-            self.station_texts.append(txt)
-    
+
     def _update_relocators(self):
-        """Update relocator positions."""
-        for relocator in car_relocator_mod.CarRelocator.relocators:
-            color = (config.RELOCATOR_COLORS["busy"] 
-                    if relocator.busy 
-                    else config.RELOCATOR_COLORS["available"])
-            txt = self.ax.text(
-                relocator.location[0], relocator.location[1],
-                config.RELOCATOR_ICON,
-                ha="center", va="center",
-                fontsize=14, color=color
-            )
-            self.relocator_texts.append(txt)
+        """Update relocator positions and colors."""
+        relocators = car_relocator_mod.CarRelocator.relocators
+        if not relocators:
+            return
+
+        # Gather positions and colors in a single pass over the fleet
+        busy_color = self._relocator_busy_color
+        available_color = self._relocator_available_color
+        offsets = []
+        colors = []
+        for relocator in relocators:
+            offsets.append(relocator.location)
+            colors.append(busy_color if relocator.is_busy else available_color)
+
+        self.relocator_scatter.set_offsets(offsets)
+        self.relocator_scatter.set_facecolor(colors)
     
     def _create_legend(self):
-        """Create legend for the visualization."""
+        """Create legend for the visualization (static, drawn once)."""
+        def car_marker(status, label):
+            return Line2D(
+                [0], [0], linestyle="", marker="o", markersize=10,
+                markerfacecolor=config.CAR_COLORS[status],
+                markeredgecolor="black", label=label
+            )
+
+        def relocator_marker(state, label):
+            return Line2D(
+                [0], [0], linestyle="", marker="s", markersize=9,
+                markerfacecolor=config.RELOCATOR_COLORS[state],
+                markeredgecolor="black", label=label
+            )
+
         legend_elements = [
-            self.ax.text(0, 0, config.CAR_ICON, color="black", label="Available Cars"),
-            self.ax.text(0, 0, config.DISCHARGED_CAR_ICON, color="black", label="Discharged Cars"),
-            self.ax.text(0, 0, config.CHARGING_CAR_ICON, color="black", label="Charging Cars"),
-            self.ax.text(0, 0, config.NEEDS_CHARGING_CAR_ICON, color="black", label="Needs Charging"),
-            self.ax.text(0, 0, config.CHARGING_STATION_ICON, color="black", label="Charging Stations"),
-            self.ax.text(0, 0, config.RELOCATOR_ICON, color="cyan", label="Available Relocators"),
-            self.ax.text(0, 0, config.RELOCATOR_ICON, color="brown", label="Busy Relocators"),
+            car_marker("available", "Available Cars"),
+            car_marker("in_use", "In-Use/Reserved Cars"),
+            car_marker("charging", "Charging Cars"),
+            car_marker("needs_charging", "Needs Charging"),
+            car_marker("discharged", "Discharged Cars"),
+            relocator_marker("available", "Available Relocators"),
+            relocator_marker("busy", "Busy Relocators"),
         ]
         self.ax.legend(
             handles=legend_elements,
             loc="upper right",
             bbox_to_anchor=(1, 1)
         )
-        self.legend_created = True